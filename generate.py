@@ -1,14 +1,33 @@
 #!/usr/bin/env python3
+"""Writes the split-out components, plus the partial App.tsx stub with --app."""
+import argparse
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-base = 'components'
+root_path = Path('.')
+components_path = Path('components')
 
+# os.open() defaults to text mode on Windows, which would rewrite \n as \r\n
+O_BINARY = getattr(os, 'O_BINARY', 0)
+
+# directory -> {name: content}, filled by write_components()/write_app()
 files = {}
 
+components = {}
+app = {}
+
+# Tailwind class blocks shared by several components
+panel_theme = "${isDark ? 'bg-[#1A1D21] border-zinc-700' : 'bg-white border-gray-200'}"
+muted_text = "${isDark ? 'text-gray-400' : 'text-gray-500'}"
+icon_button_theme = "${isDark ? 'hover:bg-zinc-700 text-gray-400 hover:text-white' : 'hover:bg-gray-100 text-gray-500 hover:text-black'}"
+swatch_border = "${isDark ? 'border-white/10' : 'border-black/5'}"
+
 # ============================================================
 # 1. QuickAddMenu.tsx
 # ============================================================
-files[os.path.join(base, 'QuickAddMenu.tsx')] = '''import React from 'react';
+components['QuickAddMenu.tsx'] = '''import React from 'react';
 import { Icons } from './Icons';
 import { NodeType } from '../types';
 
@@ -25,7 +44,7 @@ export const QuickAddMenu: React.FC<QuickAddMenuProps> = ({ quickAddMenu, isDark
 
     return (
         <div
-            className={`fixed z-50 border rounded-lg shadow-2xl py-1 min-w-[160px] flex flex-col animate-in fade-in zoom-in-95 duration-100 ${isDark ? 'bg-[#1A1D21] border-zinc-700' : 'bg-white border-gray-200'}`}
+            className={`fixed z-50 border rounded-lg shadow-2xl py-1 min-w-[160px] flex flex-col animate-in fade-in zoom-in-95 duration-100 ''' + panel_theme + '''`}
             style={{ left: quickAddMenu.x, top: quickAddMenu.y }}
             onMouseDown={(e) => e.stopPropagation()}
             onTouchStart={(e) => e.stopPropagation()}
@@ -49,7 +68,7 @@ export const QuickAddMenu: React.FC<QuickAddMenuProps> = ({ quickAddMenu, isDark
 # ============================================================
 # 2. NewWorkflowDialog.tsx
 # ============================================================
-files[os.path.join(base, 'NewWorkflowDialog.tsx')] = '''import React from 'react';
+components['NewWorkflowDialog.tsx'] = '''import React from 'react';
 import { Icons } from './Icons';
 
 interface NewWorkflowDialogProps {
@@ -74,7 +93,7 @@ export const NewWorkflowDialog: React.FC<NewWorkflowDialogProps> = ({ isDark, on
                     <h3 className="text-lg font-bold flex items-center gap-2">
                         <Icons.FilePlus size={20} className="text-cyan-500" />Create New Workflow
                     </h3>
-                    <p className={`text-xs mt-2 leading-relaxed ${isDark ? 'text-gray-400' : 'text-gray-500'}`}>
+                    <p className={`text-xs mt-2 leading-relaxed ''' + muted_text + '''`}>
                         Do you want to save your current workflow before creating a new one? <br />Any unsaved changes will be permanently lost.
                     </p>
                 </div>
@@ -104,7 +123,7 @@ export const NewWorkflowDialog: React.FC<NewWorkflowDialogProps> = ({ isDark, on
 # ============================================================
 # 3. GroupToolbar.tsx
 # ============================================================
-files[os.path.join(base, 'GroupToolbar.tsx')] = '''import React from 'react';
+components['GroupToolbar.tsx'] = '''import React from 'react';
 import { Icons } from './Icons';
 import { GROUP_COLORS } from '../hooks';
 
@@ -129,7 +148,7 @@ export const GroupToolbar: React.FC<GroupToolbarProps> = ({
             <div className={`pointer-events-auto flex items-center p-1.5 rounded-xl shadow-xl backdrop-blur-md border animate-in fade-in zoom-in-95 duration-200 relative ${isDark ? 'bg-[#1A1D21]/90 border-zinc-700' : 'bg-white/90 border-gray-200'}`}>
                 <div className="relative border-r border-gray-500/20 pr-1.5 mr-1.5">
                     <button
-                        className={`w-6 h-6 rounded-md border flex items-center justify-center transition-transform hover:scale-105 ${isDark ? 'border-white/10' : 'border-black/5'}`}
+                        className={`w-6 h-6 rounded-md border flex items-center justify-center transition-transform hover:scale-105 ''' + swatch_border + '''`}
                         style={{ backgroundColor: currentColor }}
                         onClick={(e) => { e.stopPropagation(); onToggleColorPicker(); }}
                         title="Select Color"
@@ -138,11 +157,11 @@ export const GroupToolbar: React.FC<GroupToolbarProps> = ({
                     </button>
 
                     {showColorPicker && (
-                        <div className={`absolute top-full left-0 mt-2 p-2 rounded-xl shadow-2xl border grid grid-cols-4 gap-1.5 z-50 min-w-[120px] ${isDark ? 'bg-[#1A1D21] border-zinc-700' : 'bg-white border-gray-200'}`}>
+                        <div className={`absolute top-full left-0 mt-2 p-2 rounded-xl shadow-2xl border grid grid-cols-4 gap-1.5 z-50 min-w-[120px] ''' + panel_theme + '''`}>
                             {GROUP_COLORS.map(color => (
                                 <button
                                     key={color}
-                                    className={`w-5 h-5 rounded-full border transition-transform hover:scale-125 ${isDark ? 'border-white/10' : 'border-black/5'} ${color === currentColor ? 'ring-2 ring-cyan-500 ring-offset-1 ring-offset-black/20' : ''}`}
+                                    className={`w-5 h-5 rounded-full border transition-transform hover:scale-125 ''' + swatch_border + ''' ${color === currentColor ? 'ring-2 ring-cyan-500 ring-offset-1 ring-offset-black/20' : ''}`}
                                     style={{ backgroundColor: color }}
                                     onClick={(e) => { e.stopPropagation(); onColorChange(color); }}
                                 />
@@ -169,7 +188,7 @@ export const GroupToolbar: React.FC<GroupToolbarProps> = ({
 # ============================================================
 # 4. PreviewModal.tsx
 # ============================================================
-files[os.path.join(base, 'PreviewModal.tsx')] = '''import React from 'react';
+components['PreviewModal.tsx'] = '''import React from 'react';
 import { Icons } from './Icons';
 
 interface PreviewModalProps {
@@ -204,7 +223,7 @@ export const PreviewModal: React.FC<PreviewModalProps> = ({ previewMedia, onClos
 # ============================================================
 # 5. ConnectionsLayer.tsx
 # ============================================================
-files[os.path.join(base, 'ConnectionsLayer.tsx')] = '''import React from 'react';
+components['ConnectionsLayer.tsx'] = '''import React from 'react';
 import { Icons } from './Icons';
 import { NodeData, Connection, CanvasTransform, Point } from '../types';
 
@@ -269,7 +288,7 @@ export const ConnectionsLayer: React.FC<ConnectionsLayerProps> = ({
 # ============================================================
 # 6. ZoomControls.tsx
 # ============================================================
-files[os.path.join(base, 'ZoomControls.tsx')] = '''import React from 'react';
+components['ZoomControls.tsx'] = '''import React from 'react';
 import { Icons } from './Icons';
 import { CanvasTransform, NodeData } from '../types';
 import { Minimap } from './Minimap';
@@ -302,7 +321,7 @@ export const ZoomControls: React.FC<ZoomControlsProps> = ({
                 <button
                     onClick={onToggleMinimap}
                     onTouchEnd={(e) => { e.preventDefault(); e.stopPropagation(); onToggleMinimap(); }}
-                    className={`hidden md:block p-1 rounded-full transition-colors ${isDark ? 'hover:bg-zinc-700 text-gray-400 hover:text-white' : 'hover:bg-gray-100 text-gray-500 hover:text-black'} ${showMinimap ? (isDark ? 'text-cyan-400' : 'text-cyan-600') : ''}`}
+                    className={`hidden md:block p-1 rounded-full transition-colors ''' + icon_button_theme + ''' ${showMinimap ? (isDark ? 'text-cyan-400' : 'text-cyan-600') : ''}`}
                     title={showMinimap ? "Hide Minimap" : "Show Minimap"}
                 >
                     <Icons.Map size={16} />
@@ -311,13 +330,13 @@ export const ZoomControls: React.FC<ZoomControlsProps> = ({
                 <button
                     onClick={onResetZoom}
                     onTouchEnd={(e) => { e.preventDefault(); e.stopPropagation(); onResetZoom(); }}
-                    className={`p-1 rounded-full transition-colors ${isDark ? 'hover:bg-zinc-700 text-gray-400 hover:text-white' : 'hover:bg-gray-100 text-gray-500 hover:text-black'}`}
+                    className={`p-1 rounded-full transition-colors ''' + icon_button_theme + '''`}
                     title="Reset Zoom (100%)"
                 >
                     <Icons.Maximize2 size={16} />
                 </button>
                 <input type="range" min="0.4" max="2" step="0.1" value={transform.k} onChange={onZoomChange} className="w-20 h-1 accent-cyan-500 cursor-pointer" />
-                <span className={`text-xs font-mono w-8 text-right ${isDark ? 'text-gray-400' : 'text-gray-500'}`}>{Math.round(transform.k * 100)}%</span>
+                <span className={`text-xs font-mono w-8 text-right ''' + muted_text + '''`}>{Math.round(transform.k * 100)}%</span>
             </div>
         </div>
     );
@@ -327,7 +346,7 @@ export const ZoomControls: React.FC<ZoomControlsProps> = ({
 # ============================================================
 # 7. QuickConnectSuggestions.tsx
 # ============================================================
-files[os.path.join(base, 'QuickConnectSuggestions.tsx')] = '''import React from 'react';
+components['QuickConnectSuggestions.tsx'] = '''import React from 'react';
 import { Icons } from './Icons';
 import { NodeData, NodeType } from '../types';
 
@@ -343,7 +362,7 @@ export const QuickConnectSuggestions: React.FC<QuickConnectSuggestionsProps> = (
 }) => {
     return (
         <div
-            className={`fixed z-50 border rounded-xl shadow-2xl p-2 flex flex-col gap-1 w-48 pointer-events-auto ${isDark ? 'bg-[#1A1D21] border-zinc-700' : 'bg-white border-gray-200'}`}
+            className={`fixed z-50 border rounded-xl shadow-2xl p-2 flex flex-col gap-1 w-48 pointer-events-auto ''' + panel_theme + '''`}
             style={{ left: mousePos.x + 20, top: mousePos.y }}
         >
             <div className={`text-[10px] uppercase font-bold px-2 py-1 ${isDark ? 'text-gray-500' : 'text-gray-400'}`}>Quick Connect</div>
@@ -362,10 +381,133 @@ export const QuickConnectSuggestions: React.FC<QuickConnectSuggestionsProps> = (
 };
 '''
 
-# Write all files
-for path, content in files.items():
-    with open(path, 'w') as f:
-        f.write(content.lstrip('\n'))
-    print(f"Created: {path}")
+# ============================================================
+# 8. App.tsx
+# ============================================================
+app['App.tsx'] = r'''import React, { useRef, useEffect, useCallback } from 'react';
+import Sidebar from './components/Sidebar';
+import { NodeData, CanvasTransform, Point, NodeType } from './types';
+import BaseNode from './components/Nodes/BaseNode';
+import { NodeContent } from './components/Nodes/NodeContent';
+import { ThemeSwitcher } from './components/ThemeSwitcher';
+import { SettingsModal } from './components/Settings/SettingsModal';
+import { ContextMenu } from './components/ContextMenu';
+import { QuickAddMenu } from './components/QuickAddMenu';
+import { NewWorkflowDialog } from './components/NewWorkflowDialog';
+import { GroupToolbar } from './components/GroupToolbar';
+import { PreviewModal } from './components/PreviewModal';
+import { ConnectionsLayer } from './components/ConnectionsLayer';
+import { ZoomControls } from './components/ZoomControls';
+import { QuickConnectSuggestions } from './components/QuickConnectSuggestions';
+import {
+    useCanvasState,
+    useNodeOperations,
+    useConnectionManager,
+    useClipboard,
+    useKeyboardShortcuts,
+    useGrouping,
+    calculateImportDimensions,
+} from './hooks';
+
+const App: React.FC = () => {
+    return <CanvasWithSidebar />;
+};
+'''
+
+def write_fd(fd, view):
+    """Gather-write `view` to `fd`; plain os.write where writev is unavailable (Windows)."""
+    if hasattr(os, 'writev'):
+        return os.writev(fd, [view])
+    return os.write(fd, view)
+
+
+def write_one(item):
+    """Write a single (path, data) pair of pre-encoded bytes, bypassing buffered IO."""
+    path, data = item
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[write_fd(fd, view):]
+    finally:
+        os.close(fd)
+    return path
+
+
+def is_current(path, data):
+    """True if `path` already holds exactly `data`; sizes are compared before contents."""
+    try:
+        fd = os.open(path, os.O_RDONLY | O_BINARY)
+    except FileNotFoundError:
+        return False
+    try:
+        if os.fstat(fd).st_size != len(data):
+            return False
+        return os.read(fd, len(data) + 1) == data
+    finally:
+        os.close(fd)
+
+
+def flush(only=None):
+    """Write every changed file in `files`, overlapping the syscalls on a thread pool.
+
+    If `only` is given, just the files whose name starts with it are considered.
+    Returns the (created, unchanged) path lists.
+    """
+    pending = []
+    unchanged = []
+    for base_path, group in files.items():
+        names = [name for name in group if not only or name.startswith(only)]
+        if names:
+            base_path.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            path = base_path / name
+            data = group[name].encode('utf-8')
+            if is_current(path, data):
+                unchanged.append(str(path))
+                continue
+            pending.append((path, data))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(pending)))) as pool:
+        created = [str(path) for path in pool.map(write_one, pending)]
+    return created, unchanged
+
+
+def write_components():
+    files[components_path] = components
+
+
+def write_app():
+    files[root_path] = app
+
+
+def write_all(only=None, with_app=False):
+    write_components()
+    if with_app:
+        write_app()
+    names = [name for group in files.values() for name in group]
+    if only and not any(name.startswith(only) for name in names):
+        raise ValueError(f"--only {only!r} matches none of: {', '.join(names)}")
+    created, unchanged = flush(only)
+    report = []
+    for label, paths in (('Unchanged', unchanged), ('Created', created)):
+        if paths:
+            report.append(f"{label}:\n  " + "\n  ".join(paths))
+    if with_app:
+        report.append("Note: App.tsx is only the partial 'Part 1' stub, not the full app.")
+    if created:
+        report.append(f"{len(created)} created, {len(unchanged)} unchanged.\n")
+    else:
+        report.append("Nothing to write: all selected files are up to date.\n")
+    sys.stdout.write("\n".join(report))
+
 
-print("All component files created!")
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--only', metavar='PREFIX', help="only write files whose name starts with PREFIX")
+    parser.add_argument('--app', action='store_true', help="also write the partial 'Part 1' App.tsx stub")
+    args = parser.parse_args()
+    try:
+        write_all(args.only, args.app)
+    except ValueError as e:
+        parser.error(str(e))